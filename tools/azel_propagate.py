@@ -23,12 +23,12 @@ from prg import REPO
 AZEL = os.path.join(REPO, "reference/Azel")
 FUNC_DEF = re.compile(
     r"(?:^|\n)[A-Za-z_][\w:<>,\* &]*?\b([A-Za-z_]\w+)\s*\([^;{}]*\)\s*\{")
+CALL_TOK = re.compile(r"\b([A-Za-z_]\w+)\s*\(")
 
 
 def azel_call_sets(anchor_names):
     """For each Azel function body, the subset of anchor_names it calls."""
     names = set(anchor_names)
-    tok = re.compile(r"\b([A-Za-z_]\w+)\s*\(")
     fn_calls = defaultdict(set)   # azel function name -> anchor names it calls
     for root, _dirs, files in os.walk(AZEL):
         if "/build" in root or "/ThirdParty" in root:
@@ -52,7 +52,7 @@ def azel_call_sets(anchor_names):
                             break
                     j += 1
                 body = text[i:j]
-                called = {t for t in tok.findall(body) if t in names}
+                called = {t for t in CALL_TOK.findall(body) if t in names}
                 called.discard(fname)
                 if called:
                     fn_calls[fname] |= called
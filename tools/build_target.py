@@ -25,7 +25,7 @@ def build_one(m):
     if not os.path.exists(extracted):
         fail(f"{target}: extracted/{target} missing — run `make extract`")
     with open(extracted, "rb") as f:
-        orig = f.read()
+        orig = memoryview(f.read())
 
     segments = m.get("segments") or []
     if not segments:
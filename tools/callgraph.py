@@ -22,6 +22,8 @@ VMA = 0x06006000
 DISASM = os.path.join(REPO, "build/analysis/1ST_READ.PRG.disasm.txt")
 LINE = re.compile(r"^\s*([0-9a-f]+):\s+([0-9a-f]{2} [0-9a-f]{2})\s+(\S+)\s*(.*)")
 POOL_LD = re.compile(r"mov\.l\s+0x[0-9a-f]+,r(\d+)\s*!\s*([0-9a-f]+)")
+BRANCH_TGT = re.compile(r"(0x[0-9a-f]+)")
+JSR_REG = re.compile(r"@r(\d+)")
 
 
 def load_lines():
@@ -60,11 +62,11 @@ def build(rows, insns):
             if pm:
                 loads[pm.group(1)] = int(pm.group(2), 16)
             if mnem == "bsr":
-                m = re.match(r"(0x[0-9a-f]+)", ops)
+                m = BRANCH_TGT.match(ops)
                 if m:
                     callees.append(int(m.group(1), 16))
             elif mnem == "jsr":
-                rm = re.search(r"@r(\d+)", ops)
+                rm = JSR_REG.search(ops)
                 if rm and rm.group(1) in loads:
                     callees.append(loads[rm.group(1)])
             pc += 2
@@ -25,6 +25,7 @@ import yaml
 
 BANDS = ((16, 64), (64, 128), (128, 256), (256, 512), (512, 1 << 30))
 VMA_BASE = 0x06006000
+U16 = struct.Struct(">H")  # one big-endian SH-2 opcode
 
 # Boundary correction (Bucket 3 finding): the sh2_map detector seeds a bare
 # `sts.l pr,@-r15` (0x4f22) as a function start, but SHC often schedules an
@@ -36,7 +37,7 @@ VMA_BASE = 0x06006000
 
 
 def _hw(data, off):
-    return struct.unpack(">H", data[off:off + 2])[0]
+    return U16.unpack_from(data, off)[0]
 
 
 def _prologue_only(data, a, b):
@@ -11,6 +11,13 @@ costs sensitivity, never correctness).
 import struct
 from dataclasses import dataclass, field
 
+# Fixed-layout COFF headers, unpacked in one call each (pad bytes skip the
+# fields we never read: timestamps, symtab, paddr/vaddr, line numbers).
+FILHDR = struct.Struct(">HH12xH")         # magic, nscns, opthdr
+SCNHDR = struct.Struct(">8s8xIII4xH2xI")  # name, size, scnptr, relptr, nreloc, flags
+RELOC = struct.Struct(">I4xH")             # r_vaddr, r_type (r_symndx skipped)
+SH_COFF_MAGIC = b"\x05\x00"              # f_magic 0x0500, big-endian SH
+
 
 @dataclass
 class Section:
@@ -49,18 +56,15 @@ def ar_members(path):
 
 
 def parse_coff(name, off, body):
-    f_magic, f_nscns = struct.unpack(">HH", body[0:4])
+    f_magic, f_nscns, f_opthdr = FILHDR.unpack_from(body)
     if f_magic != 0x0500:
         raise ValueError(f"{name}: unexpected COFF magic 0x{f_magic:04x}")
-    f_opthdr, = struct.unpack(">H", body[16:18])
     mod = Module(name=name, offset=off)
     base = 20 + f_opthdr
     for i in range(f_nscns):
-        sh = body[base + 40 * i: base + 40 * (i + 1)]
-        sname = sh[0:8].split(b"\0")[0].decode("ascii", "replace")
-        size, scnptr, relptr = struct.unpack(">III", sh[16:28])
-        nreloc, = struct.unpack(">H", sh[32:34])
-        flags, = struct.unpack(">I", sh[36:40])
+        (raw_name, size, scnptr, relptr, nreloc,
+         flags) = SCNHDR.unpack_from(body, base + SCNHDR.size * i)
+        sname = raw_name.split(b"\0")[0].decode("ascii", "replace")
         if size == 0:
             continue
         is_bss = bool(flags & 0x80)
@@ -69,17 +73,17 @@ def parse_coff(name, off, body):
                     contents=0 if (flags & 0x20) else 0x10,  # STYP_TEXT
                     data=raw if raw else bytes(size),
                     covered=b"\x01" * size if raw else b"\x00" * size)
-        for r in range(nreloc):
-            entry = body[relptr + 10 * r: relptr + 10 * r + 10]
-            vaddr, _symndx = struct.unpack(">II", entry[0:8])
-            rtype, = struct.unpack(">H", entry[8:10])
-            s.reloc_holes.append((vaddr, 4, rtype, None))
+        table = body[relptr:relptr + RELOC.size * nreloc]
+        if len(table) != RELOC.size * nreloc:
+            raise ValueError(f"{name}: truncated reloc table in {sname}")
+        s.reloc_holes = [(vaddr, 4, rtype, None)
+                         for vaddr, rtype in RELOC.iter_unpack(table)]
         mod.sections.append(s)
     return mod
 
 
 def modules(path):
     for name, off, body in ar_members(path):
-        if len(body) < 4 or struct.unpack(">H", body[0:2])[0] != 0x0500:
+        if len(body) < 4 or body[:2] != SH_COFF_MAGIC:
             continue  # non-object member (headers, docs) — not scannable
         yield parse_coff(name, off, body)
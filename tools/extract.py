@@ -33,6 +33,7 @@ def main():
         fail("no target manifests in config/targets/")
 
     readers = {}
+    listings = {}
     ok = 0
     for path in manifests:
         with open(path) as f:
@@ -45,9 +46,11 @@ def main():
                 fail(f"need exactly one match for {DISC_GLOBS[disc]!r} in ISOs/, "
                      f"found {len(hits)} — supply your own disc image")
             readers[disc] = ISO9660Reader(hits[0])
+            # one directory walk per disc, shared by every target on it
+            listings[disc] = {f["name"]: f for f in readers[disc].list_files()}
 
         r = readers[disc]
-        files = {f["name"]: f for f in r.list_files()}
+        files = listings[disc]
         if m["disc_path"] not in files:
             fail(f"{target}: {m['disc_path']} not found on disc {disc}")
         info = files[m["disc_path"]]
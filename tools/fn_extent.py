@@ -28,6 +28,7 @@ from prg import REPO
 
 DISASM = os.path.join(REPO, "build/analysis/1ST_READ.PRG.disasm.txt")
 LINE = re.compile(r"^\s*([0-9a-f]+):\s+[0-9a-f]{2} [0-9a-f]{2}\s+(\S+)\s*(.*)")
+BRANCH_TGT = re.compile(r"(0x[0-9a-f]+)")
 
 # delayed-branch mnemonics: the following 2-byte slot is part of this function
 DELAYED = {"bra", "bsr", "braf", "bsrf", "jmp", "jsr", "rts", "rte",
@@ -47,7 +48,7 @@ def load_disasm():
 
 
 def branch_target(ops):
-    m = re.match(r"(0x[0-9a-f]+)", ops)
+    m = BRANCH_TGT.match(ops)
     return int(m.group(1), 16) if m else None
 
 
@@ -32,6 +32,8 @@ from prg import REPO
 from sh2_map import flow_extent
 
 POOL_LD = re.compile(r"mov\.l\s+0x[0-9a-f]+,r(\d+)\s*!\s*([0-9a-f]+)")
+BRANCH_TGT = re.compile(r"(0x[0-9a-f]+)")
+JSR_REG = re.compile(r"@r(\d+)")
 LINE = re.compile(r"^\s*([0-9a-f]+):\s+[0-9a-f]{2} [0-9a-f]{2}\s+(\S+)\s*(.*)")
 EV_ORDER = ["entry", "prologue", "bsr", "jsr-pool", "jmp-pool", "ptr32"]
 
@@ -66,11 +68,11 @@ def caller_counts(starts, insn_map):
                 loads[pm.group(1)] = int(pm.group(2), 16)
             tgt = None
             if mnem == "bsr":
-                m = re.match(r"(0x[0-9a-f]+)", ops)
+                m = BRANCH_TGT.match(ops)
                 if m:
                     tgt = int(m.group(1), 16)
             elif mnem == "jsr":
-                rm = re.search(r"@r(\d+)", ops)
+                rm = JSR_REG.search(ops)
                 if rm and rm.group(1) in loads:
                     tgt = loads[rm.group(1)]
             if tgt is not None and tgt in startset and tgt not in seen_edges:
@@ -1,3 +1,4 @@
+import mmap
 import struct
 import os
 
@@ -7,40 +8,44 @@ HEADER_SIZE = 16
 DATA_SIZE = 2048
 PVD_SECTOR = 16
 
-def read_sector(f, sector_num):
-    """Reads sector data handling Mode 1 and Mode 2 Form 1/2."""
-    f.seek(sector_num * SECTOR_SIZE)
-    raw = f.read(SECTOR_SIZE)
+def read_sector(img, sector_num):
+    """Reads sector data handling Mode 1 and Mode 2 Form 1/2.
+
+    `img` is the whole disc image (the reader's mmap): the payload is sliced
+    straight out of it, no seek+read per sector."""
+    base = sector_num * SECTOR_SIZE
     
-    if len(raw) < SECTOR_SIZE:
+    if base + SECTOR_SIZE > len(img):
         return b''
 
     # Mode is at offset 15
-    mode = raw[15]
+    mode = img[base + 15]
     
     if mode == 1:
         # Mode 1: Header 16, Data 2048
-        return raw[16:16+2048]
+        return img[base+16:base+16+2048]
     elif mode == 2:
         # Mode 2
         # Submode is at offset 18 (16 + 2)
-        submode = raw[18]
+        submode = img[base + 18]
         if submode & 0x20: # Form 2 bit
             # Form 2: Header 16, Subheader 8, Data 2324
-            return raw[24:24+2324]
+            return img[base+24:base+24+2324]
         else:
             # Form 1: Header 16, Subheader 8, Data 2048
-            return raw[24:24+2048]
-    return raw[16:16+2048] # Fallback
+            return img[base+24:base+24+2048]
+    return img[base+16:base+16+2048] # Fallback
 
 class ISO9660Reader:
     def __init__(self, bin_path):
         self.f = open(bin_path, 'rb')
+        # Map the image once; sectors are then plain slices of the mapping
+        self.img = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_READ)
         self._parse_pvd()
         
     def _parse_pvd(self):
         # Read Primary Volume Descriptor
-        self.pvd = read_sector(self.f, PVD_SECTOR)
+        self.pvd = read_sector(self.img, PVD_SECTOR)
         # Root Directory Record starts at byte 156
         self.root_record = self.pvd[156:190] 
         # Parse Root LBA (Location of Extent) - Offset 2 in record, 4 bytes LE, 4 bytes BE
@@ -55,9 +60,9 @@ class ISO9660Reader:
         
     def _scan_dir(self, lba, size, file_list, path_prefix=""):
         num_sectors = (size + DATA_SIZE - 1) // DATA_SIZE
-        data = b''
-        for i in range(num_sectors):
-            data += read_sector(self.f, lba + i)
+        # One join, not a growing bytes += (which re-copies per sector)
+        data = b''.join(read_sector(self.img, lba + i)
+                        for i in range(num_sectors))
             
         offset = 0
         while offset < len(data):
@@ -93,10 +98,18 @@ class ISO9660Reader:
 
     def extract_file(self, lba, size):
         num_sectors = (size + DATA_SIZE - 1) // DATA_SIZE
+        # Trim the sector that crosses `size` and stop there, so the join
+        # allocates the file once at its exact length (no [:size] re-copy)
         chunks = []
+        remaining = size
         for i in range(num_sectors):
-            chunks.append(read_sector(self.f, lba + i))
-        return b''.join(chunks)[:size]
+            if remaining <= 0:
+                break
+            sector = read_sector(self.img, lba + i)
+            chunks.append(sector[:remaining])
+            remaining -= len(sector)
+        return b''.join(chunks)
         
     def close(self):
+        self.img.close()
         self.f.close()
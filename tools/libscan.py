@@ -19,12 +19,15 @@ Nothing here writes to the repo; results are printed for review.
 """
 import argparse
 import os
+import re
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import coffar
 import sysrof
 
+FIXED_RUN = re.compile(rb"[^\x00]+")  # maximal run of fixed (nonzero) mask bytes
+
 
 def load_modules(path):
     """Dispatch on container format: ar (.A, GNU sh-coff) or SYSROF (.LIB/.OBJ)."""
@@ -35,37 +38,35 @@ def load_modules(path):
     return sysrof.modules(path)
 
 
+def fixed_runs(mask):
+    """[(start, end)] of every maximal fixed-byte run (one C-level scan)."""
+    return [m.span() for m in FIXED_RUN.finditer(mask)]
+
+
 def longest_fixed_run(mask):
     best = (0, 0)  # (length, start)
-    cur_start = None
-    for i, b in enumerate(mask):
-        if b and cur_start is None:
-            cur_start = i
-        elif not b and cur_start is not None:
-            best = max(best, (i - cur_start, cur_start))
-            cur_start = None
-    if cur_start is not None:
-        best = max(best, (len(mask) - cur_start, cur_start))
+    for a, b in fixed_runs(mask):
+        best = max(best, (b - a, a))
     return best[1], best[0]  # start, length
 
 
-def masked_match(target, pos, data, mask):
+def masked_match(target, pos, data, runs):
+    """Every fixed run of the fingerprint equals the target at pos; runs are
+    compared as slices, wildcards between them are skipped."""
     if pos < 0 or pos + len(data) > len(target):
         return False
-    for i in range(len(data)):
-        if mask[i] and target[pos + i] != data[i]:
-            return False
-    return True
+    return all(target[pos + a:pos + b] == data[a:b] for a, b in runs)
 
 
 def find_placements(target, data, mask, align=2):
+    runs = fixed_runs(mask)
     astart, alen = longest_fixed_run(mask)
     anchor = data[astart:astart + alen]
     hits = []
     j = target.find(anchor)
     while j != -1:
         pos = j - astart
-        if pos % align == 0 and masked_match(target, pos, data, mask):
+        if pos % align == 0 and masked_match(target, pos, data, runs):
             hits.append(pos)
         j = target.find(anchor, j + 1)
     return hits
@@ -85,7 +86,7 @@ def scan(target, libpaths, min_fixed=16, which="code"):
                 if s.length == 0 or not any(s.covered):
                     continue
                 data, mask = sysrof.section_image(s)
-                fixed = sum(1 for b in mask if b)
+                fixed = len(mask) - mask.count(0)
                 if fixed < min_fixed:
                     hits, status = [], "too-small"
                 else:
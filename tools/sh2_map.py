@@ -31,6 +31,7 @@ import bisect
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
 
@@ -40,6 +41,8 @@ LINE = re.compile(
     r"^\s*([0-9a-f]+):\s+([0-9a-f]{2} [0-9a-f]{2})\s+(\S+)\s*(.*?)\s*$")
 POOL_LOAD = re.compile(r"^0x([0-9a-f]+),(r\d+)\s+!\s*([0-9a-f]+)")
 PUSH = re.compile(r"^(r\d+),@-r15")
+DEST_REG = re.compile(r",(r\d+)$")
+BRANCH_TGT = re.compile(r"(0x[0-9a-f]+)")
 
 
 def disasm(target, extracted, vma_base):
@@ -50,9 +53,9 @@ def disasm(target, extracted, vma_base):
     out = os.path.join(workdir, f"{target}.disasm.txt")
     if not os.path.exists(out) or (os.path.getmtime(out) <
                                    os.path.getmtime(extracted)):
-        sub = os.path.join(workdir, target)
-        with open(extracted, "rb") as f, open(sub, "wb") as g:
-            g.write(f.read())
+        # the container only sees workdir; copyfile stages the PRG there
+        # kernel-side (sendfile) rather than round-tripping it through Python
+        shutil.copyfile(extracted, os.path.join(workdir, target))
         subprocess.run(
             [os.path.join(REPO, "toolchain/shc/run.sh"), workdir,
              f"sh-elf-objdump -D -b binary -m sh2 -EB "
@@ -139,7 +142,7 @@ class Mapper:
                         call_targets[val] = f"{mnem}-pool"
             else:
                 # a write to a register invalidates its tracked pool load
-                dst = re.search(r",(r\d+)$", ops)
+                dst = DEST_REG.search(ops)
                 if dst and dst.group(1) in recent_loads:
                     del recent_loads[dst.group(1)]
             prev_push_reg = pushed
@@ -187,7 +190,7 @@ _UNCOND_TERM = {"rts", "rte", "jmp", "braf", "bsrf"}
 
 
 def _branch_target(ops):
-    m = re.match(r"(0x[0-9a-f]+)", ops)
+    m = BRANCH_TGT.match(ops)
     return int(m.group(1), 16) if m else None
 
 
@@ -266,8 +269,8 @@ def ptr32_starts(data, vma_base, insn_by_addr, pool):
     import struct
     end = vma_base + len(data)
     hits = set()
-    for off in range(0, len(data) - 3, 4):
-        v = struct.unpack_from(">I", data, off)[0]
+    # every aligned longword in one pass (the file offset itself is unused)
+    for v, in struct.iter_unpack(">I", memoryview(data)[:len(data) & ~3]):
         if not (vma_base <= v < end) or v % 2:
             continue
         prev = insn_by_addr.get(v - 4)
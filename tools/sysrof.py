@@ -31,6 +31,13 @@ from dataclasses import dataclass, field
 
 MODULE_MAGIC = b"\x80\x21\x00\x80"
 
+# Big-endian field readers, compiled once and applied in place with
+# unpack_from (no per-field payload slices in the record loops).
+U16 = struct.Struct(">H")
+U32 = struct.Struct(">I")
+U16_PAIR = struct.Struct(">HH")
+U32_PAIR = struct.Struct(">II")
+
 
 @dataclass
 class Section:
@@ -94,7 +101,7 @@ def _ed_entries(buf):
     """
     out, i = [], 0
     while i + 8 <= len(buf):
-        sect, = struct.unpack(">H", buf[i:i + 2])
+        sect, = U16.unpack_from(buf, i)
         typ = buf[i + 2]
         i += 3
         if typ & 0x40:
@@ -102,7 +109,7 @@ def _ed_entries(buf):
             addr = int.from_bytes(buf[i + 1:i + 1 + asz], "big")
             i += 1 + asz
         else:
-            addr, = struct.unpack(">I", buf[i:i + 4])
+            addr, = U32.unpack_from(buf, i)
             i += 4
         ln = buf[i]
         name = buf[i + 1:i + 1 + ln].decode("ascii", "replace")
@@ -126,15 +133,14 @@ def parse_module(data, start, end):
             pass
         elif kind == 0x06:  # un: format,spare, nsect:1, nref:2, ndef:2, [n]name [n]tool [tcd:12]...
             nsect = p[2]
-            nref, ndef = struct.unpack(">HH", p[3:7])
+            nref, ndef = U16_PAIR.unpack_from(p, 3)
             i = 7
             ln = p[i]; mod.name = p[i + 1:i + 1 + ln].decode("ascii", "replace"); i += 1 + ln
             ln = p[i]; mod.tool = p[i + 1:i + 1 + ln].decode("ascii", "replace"); i += 1 + ln
         elif kind == 0x08:  # sc: fmt, spare, segadd:4?, addr.., length:4, align, contents.., [n]name
             # observed payload: 40 00 | 00 00 00 | 00 00 01 28 | 00 00 00 04 |
             #                   00 ff c0 | 06 'SEGA_P'   (length at [5:9])
-            length, = struct.unpack(">I", p[5:9])
-            align, = struct.unpack(">I", p[9:13])
+            length, align = U32_PAIR.unpack_from(p, 5)
             contents = p[13]  # 0x00 = code, 0x10 = const data (attr bytes p[13:16])
             nlen = p[16]
             name = p[17:17 + nlen].decode("ascii", "replace")
@@ -147,13 +153,13 @@ def parse_module(data, start, end):
         elif kind == 0x14:  # ed
             mod.ext_defs.extend(_ed_entries(p))
         elif kind == 0x1A:  # sh: unit:2, section:2
-            sect_idx, = struct.unpack(">H", p[2:4])
+            sect_idx, = U16.unpack_from(p, 2)
             cur_sect = mod.sections[sect_idx]
         elif kind == 0x1C:  # ob
             flags = p[0]
-            addr, = struct.unpack(">I", p[1:5])
+            addr, = U32.unpack_from(p, 1)
             if flags & 0x40:  # compressed: [reps:4][datalen][pattern]
-                reps, = struct.unpack(">I", p[5:9])
+                reps, = U32.unpack_from(p, 5)
                 dlen = p[9]
                 blob = bytes(p[10:10 + dlen]) * reps
             else:
@@ -163,9 +169,11 @@ def parse_module(data, start, end):
                     raise ValueError(f"short ob record in {mod.name}")
             if cur_sect is None:
                 raise ValueError(f"ob before sh in {mod.name}")
+            if addr + len(blob) > cur_sect.length:
+                raise ValueError(
+                    f"ob addr 0x{addr:x} beyond {cur_sect.name} in {mod.name}")
             cur_sect.data[addr:addr + len(blob)] = blob
-            for k in range(addr, addr + len(blob)):
-                cur_sect.covered[k] = 1
+            cur_sect.covered[addr:addr + len(blob)] = b"\x01" * len(blob)
         elif kind == 0x20:  # rl: variable-length entries
             # [flags][spare:2][addr:2][bitloc][flen][bcount][expr... 0xff]
             # flags>>2 = 1-based appearance number of the section holding the
@@ -175,7 +183,7 @@ def parse_module(data, start, end):
             i = 0
             while i + 8 <= len(p):
                 segment = p[i] >> 2
-                addr, = struct.unpack(">H", p[i + 3:i + 5])
+                addr, = U16.unpack_from(p, i + 3)
                 flen = p[i + 6]
                 bcount = p[i + 7]
                 expr = p[i + 8:i + 8 + bcount]
@@ -217,8 +225,9 @@ def section_image(sect):
     0 = wildcard (relocation hole or never-emitted filler)."""
     mask = bytearray(sect.covered)
     for off, nbytes, _op, _seg in sect.reloc_holes:
-        for k in range(off, min(off + nbytes, len(mask))):
-            mask[k] = 0
+        end = min(off + nbytes, len(mask))
+        if end > off:
+            mask[off:end] = bytes(end - off)
     return bytes(sect.data), bytes(mask)
 
 
@@ -38,6 +38,7 @@ MAP = os.path.join(REPO, "build/analysis/1ST_READ.PRG.map.json")
 LINE = re.compile(r"^\s*([0-9a-f]+):\s+[0-9a-f]{2} [0-9a-f]{2}\s+(\S+)\s*(.*)")
 POOL_LD = re.compile(r"mov\.[lw]\s+(0x[0-9a-f]+),r\d+")
 MOVA = re.compile(r"mova\s+(0x[0-9a-f]+),r0")
+BRANCH_TGT = re.compile(r"(0x[0-9a-f]+)")
 
 
 def load():
@@ -64,7 +65,7 @@ def refs_of(start, insn):
             continue
         mn, ops = insn[pc]
         if mn == "bsr":
-            m = re.match(r"(0x[0-9a-f]+)", ops)
+            m = BRANCH_TGT.match(ops)
             if m:
                 bsrs.add(int(m.group(1), 16))
         pm = POOL_LD.match(f"{mn} {ops}") or MOVA.match(f"{mn} {ops}")
@@ -34,6 +34,7 @@ WRAMH_SATURN_BASE = 0x06000000
 ANCHOR_TARGET = "1ST_READ.PRG"
 ANCHOR_VMA = 0x06006000
 ANCHOR_LEN = 4096          # leading bytes used to locate the anchor
+MATCH_BLOCK = 4096         # compare granularity for match_len
 
 
 def calibrate(state):
@@ -59,12 +60,18 @@ def calibrate(state):
 
 
 def match_len(state, off, data):
-    n = 0
-    for i, b in enumerate(data):
-        if off + i >= len(state) or state[off + i] != b:
-            break
-        n += 1
-    return n
+    """Length of the common prefix of data and state[off:]. Whole blocks
+    are compared as slices in C; only the block holding the first
+    difference is walked byte by byte."""
+    sv = memoryview(state)[off:off + len(data)]
+    dv = memoryview(data)[:len(sv)]
+    for blk in range(0, len(sv), MATCH_BLOCK):
+        end = blk + MATCH_BLOCK
+        if sv[blk:end] != dv[blk:end]:
+            for i in range(blk, min(end, len(sv))):
+                if sv[i] != dv[i]:
+                    return i
+    return len(sv)
 
 
 def main():